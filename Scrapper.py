@@ -1,127 +1,364 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html as lxml_html
+import io
 import time
 import re
-from datetime import datetime
+import shelve
+import threading
+from functools import lru_cache
+from urllib.parse import urljoin
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from utils import RateLimiter, setup_queue_logging
+
+# Number of article pages fetched concurrently once the listing pages are scanned
+ARTICLE_FETCH_WORKERS = 8
+# Politeness limit shared by all article workers: at most ARTICLE_RATE requests per
+# second on average, with bursts of up to ARTICLE_BURST after an idle spell
+ARTICLE_RATE = 4.0
+ARTICLE_BURST = 4
+
+ET_BASE_URL = 'https://economictimes.indiatimes.com'
+
+# Listing pages are kept in a small on-disk cache for a few minutes, so repeated
+# runs during development don't download them again
+LISTING_CACHE_PATH = 'et_listing_cache'
+LISTING_CACHE_TTL = 300  # seconds
+
+# Article text collected per page; the story is told well within this, and the
+# paragraphs after it are related stories, disclaimers and promos
+MAX_CONTENT_CHARS = 4000
+
+# --- Logging ---
+# Routed through the shared logging queue by the __main__ block (setup_queue_logging),
+# so worker threads never block on the terminal.
+logger = logging.getLogger('scraper')
+logger.setLevel(logging.INFO)
+
+# --- Precompiled date patterns ---
+# "Aug 1, 2025" and "1 Aug 2025" style dates found in listing timestamps
+_MONTHS = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)'
+# Both layouts in one alternation, so a single search handles either
+_DATE_RE = re.compile(rf'\b{_MONTHS}\s+\d{{1,2}},\s+\d{{4}}|\d{{1,2}}\s+{_MONTHS}\s+\d{{4}}')
+
+# Cross-links and app/social promos mixed into the article paragraphs, matched
+# case-insensitively at the start of a paragraph in a single regex pass
+_JUNK_PREFIX_RE = re.compile(
+    r'(?:also read:|read more:|download the economic times app|by downloading the app'
+    r'|follow us on|join us on|view more|watch now|trending now)',
+    re.IGNORECASE
+)
+
+# Absolute ET article URLs, checked in one scan instead of several substring tests
+_ARTICLE_URL_RE = re.compile(r'https?://[^/]*economictimes\.indiatimes\.com/(?:.*/)?articleshow/')
+
+
+def _has_class(name):
+    """XPath predicate matching one token of the class attribute, like bs4's class_ filter."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# --- Selector rules (highest priority first) ---
+# Each rule is (tag, attribute, value). The class attribute is matched per token and
+# a rule without an attribute accepts any element with that tag.
+BODY_RULES = (
+    ('div', 'class', 'artcontent'),
+    ('div', 'class', 'Normal'),  # Older or different layout
+    ('div', 'class', 'article_body'),  # Another possible class
+    ('section', 'itemprop', 'articleBody'),  # Fallback for some structures
+)
+
+
+def _compile_rules(rules):
+    """Compiles selector rules into one XPath that collects every candidate in a single document walk."""
+    tests = []
+    for tag, attr, value in rules:
+        if attr is None:
+            tests.append(f"self::{tag}")
+        elif attr == 'class':
+            tests.append(f"(self::{tag} and {_has_class(value)})")
+        else:
+            tests.append(f"(self::{tag} and @{attr}='{value}')")
+    return etree.XPath(f"//*[{' or '.join(tests)}]")
+
+
+def _rule_rank(element, rules):
+    """Returns the index of the first rule the element satisfies."""
+    for rank, (tag, attr, value) in enumerate(rules):
+        if element.tag != tag:
+            continue
+        if attr is None:
+            return rank
+        found = element.get(attr)
+        if found is not None and (value in found.split() if attr == 'class' else found == value):
+            return rank
+    return len(rules)
 
 
-# (Keep get_html_content function as is)
-def get_html_content(url, retries=3, delay=2):
+def _select(tree, xpath, rules):
     """
-    Fetches the HTML content of a given URL with retries and delays.
+    Returns the element matching the highest-priority rule (first in document order
+    among equals), or None. Replaces a ladder of find() calls with one XPath walk.
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    for i in range(retries):
-        try:
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
-            return response.content
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching {url}: {e}")
-            if i < retries - 1:
-                print(f"Retrying in {delay} seconds...")
-                time.sleep(delay)
-            else:
-                print(f"Failed to fetch {url} after {retries} attempts.")
-                return None
-    return None
+    best, best_rank = None, len(rules)
+    for element in xpath(tree):
+        rank = _rule_rank(element, rules)
+        if rank < best_rank:
+            best, best_rank = element, rank
+            if rank == 0:
+                break
+    return best
 
 
-# (Keep parse_article_page function as is for now, we'll confirm its effectiveness after this part)
-def parse_article_page(article_url):
+# --- Precompiled XPath selectors ---
+BODY_XPATH = _compile_rules(BODY_RULES)
+PARAGRAPH_XPATH = etree.XPath(".//p")
+
+# The news items of the first ul.data list, found in one walk of the listing page
+NEWS_ITEM_XPATH = etree.XPath(f"(//ul[{_has_class('data')}])[1]//li[@itemprop='itemListElement']")
+# The link and the timestamp of an item, collected together in document order
+ITEM_PARTS_XPATH = etree.XPath(f".//a[@href] | .//span[{_has_class('timestamp')}][@data-time]")
+
+
+@lru_cache(maxsize=4096)
+def absolute_url(href):
     """
-    Parses a single Economic Times article page to extract title, date, and content.
+    Resolves a listing href against the ET site root.
+    Cached because the same links show up on several listing pages.
     """
-    print(f"Scraping article: {article_url}")
-    html_content = get_html_content(article_url)
-    if not html_content:
+    return urljoin(ET_BASE_URL + '/', href)
+
+
+_parser_local = threading.local()
+
+
+def get_parser():
+    """
+    Returns this thread's HTML parser, creating it on first use.
+    lxml parsers are not thread-safe, so each worker keeps its own and reuses it
+    across pages. Comments (inline ad/JS blocks) are dropped while parsing.
+    """
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = lxml_html.HTMLParser(encoding='utf-8', remove_comments=True, collect_ids=False)
+        _parser_local.parser = parser
+    return parser
+
+
+def parse_html(html_content):
+    """Parses raw HTML bytes into an lxml tree. Economic Times serves UTF-8."""
+    return lxml_html.fromstring(html_content, parser=get_parser())
+
+
+# --- Shared HTTP Session ---
+# One session for the whole run so the listing and article pages reuse pooled
+# keep-alive connections instead of paying a new TCP+TLS handshake per URL.
+# urllib3's Retry takes care of retrying failed requests with exponential backoff.
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+# The session is shared by the article worker threads; the pool must hold at least
+# ARTICLE_FETCH_WORKERS connections or the extra ones get discarded after each use.
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=max(32, ARTICLE_FETCH_WORKERS),
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# Shared by all article workers, see ARTICLE_RATE
+ARTICLE_RATE_LIMITER = RateLimiter(ARTICLE_RATE, ARTICLE_BURST)
+
+
+def get_listing_html(url):
+    """
+    Returns the HTML of a listing page, served from the on-disk cache while it
+    is younger than LISTING_CACHE_TTL. After that the page is revalidated with
+    its ETag/Last-Modified, so an unchanged page is not downloaded again.
+    """
+    with shelve.open(LISTING_CACHE_PATH) as cache:
+        cached = cache.get(url)
+    if not isinstance(cached, dict):
+        cached = None  # Nothing cached yet, or an entry from an older cache format
+    if cached and time.time() - cached['fetched_at'] < LISTING_CACHE_TTL:
+        return cached['content']
+
+    headers = {}
+    if cached and cached['etag']:
+        headers['If-None-Match'] = cached['etag']
+    if cached and cached['last_modified']:
+        headers['If-Modified-Since'] = cached['last_modified']
+
+    try:
+        response = SESSION.get(url, headers=headers, timeout=10)
+        response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
+    except requests.exceptions.RequestException as e:
+        logger.error("Failed to fetch %s: %s", url, e)
         return None
 
-    soup = BeautifulSoup(html_content, 'lxml')
-
-    title = ""
-    date = ""
-    content = []
-
-    # --- Extract Title ---
-    # Common selectors for titles on ET article pages
-    title_element = soup.find('h1', {'class': 'artTitle'})  # Main title class
-    if not title_element:
-        title_element = soup.find('h1', {'class': 'article_title'})  # Another possible title class
-    if not title_element:
-        title_element = soup.find('h1')  # Fallback to any h1
-
-    if title_element:
-        title = title_element.get_text(strip=True)
-
-    # --- Extract Date ---
-    # Dates are often in span/div with specific classes, or within meta tags
-    date_element = soup.find('time', {'class': 'publishedAt'})
-    if not date_element:
-        date_element = soup.find('div', {'class': 'publish_on'})
-    if not date_element:
-        date_element = soup.find('span', {'class': 'byline_data'})  # Another common class
-
-    if date_element:
-        date = date_element.get_text(strip=True)
-        # Often date strings need cleaning, e.g., "Updated: Aug 1, 2025, 08:45 AM IST"
-        # We can use regex to extract just the date part if needed
-        match = re.search(r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4}', date)
-        if match:
-            date = match.group(0)
-        else:
-            match = re.search(r'\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}', date)
-            if match:
-                date = match.group(0)
+    if response.status_code == 304:  # Not Modified, the cached copy is still current
+        entry = dict(cached, fetched_at=time.time())
+    else:
+        entry = {
+            'fetched_at': time.time(),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content': response.content
+        }
+    with shelve.open(LISTING_CACHE_PATH) as cache:
+        cache[url] = entry
+    return entry['content']
+
+
+def fetch_html_tree(url):
+    """
+    Streams the page at the given URL straight into an lxml parser, so parsing
+    overlaps the download instead of buffering the whole body first.
+    Returns the parsed tree, or None if the page could not be fetched.
+    """
+    parser = get_parser()
+    try:
+        with SESSION.get(url, stream=True, timeout=10) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=65536):
+                parser.feed(chunk)
+        return parser.close()
+    except requests.exceptions.RequestException as e:
+        logger.error("Failed to fetch %s: %s", url, e)
+        # The download broke off mid-feed; close the parser so the next page starts clean
+        try:
+            parser.close()
+        except etree.XMLSyntaxError:
+            pass
+    except etree.XMLSyntaxError as e:  # Empty body
+        logger.error("Could not parse %s: %s", url, e)
+    return None
+
 
-    # --- Extract Article Content ---
+def extract_article_body(tree):
+    """
+    Extracts the article text from a parsed page as newline-separated paragraphs.
+    """
+    # Paragraphs are written straight into one buffer instead of a list joined at the end
+    content = io.StringIO()
     # The main article content is usually within a specific div/article tag.
     # We need to find the container that holds the main body of the text
     # and then extract all paragraph tags within it.
-
-    # Common article body container classes on ET
-    article_body = soup.find('div', {'class': 'artcontent'})
-    if not article_body:
-        article_body = soup.find('div', {'class': 'Normal'})  # Older or different layout
-    if not article_body:
-        article_body = soup.find('div', {'class': 'article_body'})  # Another possible class
-    if not article_body:  # Fallback for some structures
-        article_body = soup.find('section', {'itemprop': 'articleBody'})
-
-    if article_body:
-        paragraphs = article_body.find_all('p')
-        for p in paragraphs:
+    article_body = _select(tree, BODY_XPATH, BODY_RULES)
+    if article_body is not None:
+        for p in PARAGRAPH_XPATH(article_body):
             # Filter out short paragraphs that might be captions, ads, or junk
-            paragraph_text = p.get_text(strip=True)
-            if len(paragraph_text) > 50 and not paragraph_text.startswith(
-                    "Also Read:") and not paragraph_text.lower().startswith("read more:"):
-                content.append(paragraph_text)
+            paragraph_text = p.text_content().strip()
+            if len(paragraph_text) <= 50 or _JUNK_PREFIX_RE.match(paragraph_text):
+                continue
+            content.write(paragraph_text)
+            content.write("\n")
+            if content.tell() > MAX_CONTENT_CHARS:
+                break  # The rest of the body is boilerplate
+    return content.getvalue().rstrip("\n")
 
-    full_content = "\n".join(content)
 
-    if not title and not full_content:  # If both are empty, it's likely a bad scrape
-        print(f"Warning: Could not extract significant content from {article_url}")
+def fetch_article_body(article_url):
+    """
+    Fetches an article page and extracts only its body text, for callers that
+    already have the title and date from the listing page.
+    Returns None if the page could not be fetched.
+    """
+    logger.debug("Scraping article: %s", article_url)
+    tree = fetch_html_tree(article_url)
+    if tree is None:
         return None
+    return extract_article_body(tree)
+
 
+def scrape_article(candidate):
+    """
+    Scrapes the article body for a (url, title, date) candidate found on a listing page.
+    The listing already has a clean title and date, so only the body is extracted.
+    Runs inside the worker pool; the shared rate limiter keeps the workers polite together.
+    """
+    article_url, title, formatted_date = candidate
+    ARTICLE_RATE_LIMITER.acquire()  # Be polite, cap the request rate across all workers
+    content = fetch_article_body(article_url)
+
+    if content is None:  # The page could not be fetched, keep what the listing gave us
+        content = 'Failed to scrape full content'
     return {
         'title': title,
-        'date': date,
-        'content': full_content,
+        'date': formatted_date,
+        'content': content,
         'url': article_url,
         'source': 'Economic Times'
     }
 
 
-def scrape_economic_times_headlines(base_url, num_articles_limit=10):
+def _extract_listing_candidates(tree, page_url):
+    """
+    Extracts (article_url, title, formatted_date) for every article link on a
+    parsed listing page, in page order. Duplicates are left to the caller.
+    """
+    candidates = []
+
+    # All <li> news items within the <ul> with class="data"
+    news_items = NEWS_ITEM_XPATH(tree)
+
+    if not news_items:
+        logger.warning("No news items found in the ul.data container on %s. Check HTML structure again.", page_url)
+        return candidates
+
+    for item in news_items:
+        # The first <a> (title and URL) and the first timestamp <span>, from a single XPath walk
+        link_tag = timestamp_tag = None
+        for part in ITEM_PARTS_XPATH(item):
+            if part.tag == 'a':
+                if link_tag is None:
+                    link_tag = part
+            elif timestamp_tag is None:
+                timestamp_tag = part
+
+        if link_tag is None or timestamp_tag is None:
+            continue
+
+        # Ensure the URL is absolute, and skip non-article links
+        article_url = absolute_url(link_tag.get('href'))
+        if not _ARTICLE_URL_RE.match(article_url):
+            continue
+
+        title = link_tag.text_content().strip()
+
+        # Extract date from data-time attribute for better accuracy
+        date_str = timestamp_tag.get('data-time')
+        # The format is 'YYYY-MM-DDTHH:MM:SS+HH:MM' or similar. We want just the date.
+        # Example: 2025-08-01T19:43:00Z -> 2025-08-01
+        # Or '2025-08-02, 01:13 AM IST' -> 2025-08-02 (from the displayed text)
+        # Let's prioritize data-time as it's cleaner
+        if len(date_str) >= 10 and date_str[4] == '-' and date_str[7] == '-':
+            # ISO timestamps already start with the date, no need for a full parse
+            formatted_date = date_str[:10]
+        else:
+            # Fallback to the displayed text if data-time is not a standard ISO format
+            # or if we prefer the displayed text for some reason
+            display_date_text = timestamp_tag.text_content().strip()
+            match = _DATE_RE.search(display_date_text)
+            # Keep raw if unable to parse
+            formatted_date = match.group(0) if match else display_date_text
+
+        candidates.append((article_url, title, formatted_date))
+
+    return candidates
+
+
+def iter_economic_times_articles(base_url, num_articles_limit=10):
     """
     Scrapes headlines and article URLs from Economic Times listing pages
     based on the latest HTML structure provided in the screenshot.
-    Then, for each article URL, scrapes the full article content.
+    Then scrapes the full content of the collected article URLs concurrently,
+    yielding each article as soon as it is ready (in listing order).
     """
-    all_articles_data = []
-    seen_urls = set()  # To avoid scraping the same article multiple times
+    # article_url -> (title, formatted_date); a dict dedupes while keeping listing order
+    unique_articles = {}
 
     # The base_url argument is just for the function signature,
     # we'll use a hardcoded list of relevant ET news URLs for broader coverage.
@@ -132,119 +369,58 @@ def scrape_economic_times_headlines(base_url, num_articles_limit=10):
         # You can add more category pages here.
     ]
 
+    # --- Phase 1: Collect candidate article links from the listing pages ---
     for page_url in urls_to_scrape:
-        print(f"Fetching news from listing page: {page_url}")
-        html_content = get_html_content(page_url)
+        logger.info("Fetching news from listing page: %s", page_url)
+        html_content = get_listing_html(page_url)
         if not html_content:
             continue
 
-        soup = BeautifulSoup(html_content, 'lxml')
+        for article_url, title, formatted_date in _extract_listing_candidates(parse_html(html_content), page_url):
+            unique_articles.setdefault(article_url, (title, formatted_date))
 
-        # Target the <ul> with class="data" as the main container
-        news_list_container = soup.find('ul', class_='data')
+        # Limit the number of articles for a quick test run
+        if len(unique_articles) >= num_articles_limit:  # Use the passed limit
+            logger.info("Reached article limit (%s) for testing, stopping.", num_articles_limit)
+            break  # No need to fetch the remaining listing pages
 
-        if not news_list_container:
-            print(f"Could not find news list container on {page_url}. Check HTML structure again.")
-            continue  # Move to the next URL if container is not found
+    candidates = [(article_url, title, formatted_date)
+                  for article_url, (title, formatted_date) in unique_articles.items()][:num_articles_limit]
+    for article_url, _, _ in candidates:
+        logger.debug("Found article link: %s", article_url)
 
-        # Find all <li> elements within this container
-        news_items = news_list_container.find_all('li', itemprop='itemListElement')
+    # --- Phase 2: Fetch the article pages concurrently ---
+    # The fetches are network-bound, so a small thread pool overlaps them;
+    # map() keeps the results in the same order as the listing pages.
+    with ThreadPoolExecutor(max_workers=ARTICLE_FETCH_WORKERS) as executor:
+        yield from executor.map(scrape_article, candidates)
 
-        if not news_items:
-            print(f"No news items found within the container on {page_url}. Check LI structure.")
-            continue
 
-        for item in news_items:
-            # Extract the <a> tag which contains the title and URL
-            link_tag = item.find('a', href=True)
-
-            # Extract the <span> tag for the timestamp
-            timestamp_tag = item.find('span', class_='timestamp', attrs={'data-time': True})
-
-            if link_tag and timestamp_tag:
-                title = link_tag.get_text(strip=True)
-                article_url = link_tag['href']
-
-                # Extract date from data-time attribute for better accuracy
-                date_str = timestamp_tag['data-time']
-                # The format is 'YYYY-MM-DDTHH:MM:SS+HH:MM' or similar. We want just the date.
-                try:
-                    # Example: 2025-08-01T19:43:00Z -> 2025-08-01
-                    # Or '2025-08-02, 01:13 AM IST' -> 2025-08-02 (from get_text)
-                    # Let's prioritize data-time as it's cleaner
-                    parsed_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                    formatted_date = parsed_date.strftime('%Y-%m-%d')
-                except ValueError:
-                    # Fallback to get_text if data-time is not a standard ISO format
-                    # or if we prefer the displayed text for some reason
-                    display_date_text = timestamp_tag.get_text(strip=True)
-                    match = re.search(r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4}',
-                                      display_date_text)
-                    if match:
-                        formatted_date = match.group(0)
-                    else:
-                        match = re.search(r'\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}',
-                                          display_date_text)
-                        if match:
-                            formatted_date = match.group(0)
-                        else:
-                            formatted_date = display_date_text  # Keep raw if unable to parse
-
-                # Ensure the URL is absolute
-                if not article_url.startswith('http'):
-                    article_url = f"https://economictimes.indiatimes.com{article_url}"
-
-                # Filter out non-article links and avoid duplicates
-                if "/articleshow/" in article_url and "economictimes.indiatimes.com" in article_url and article_url not in seen_urls:
-                    print(f"Found article link: {article_url}")  # Debugging line
-
-                    # Call parse_article_page to get full content
-                    article_details = parse_article_page(article_url)
-
-                    if article_details:
-                        # Override title and date if we got better ones from listing page
-                        article_details['title'] = title
-                        article_details['date'] = formatted_date  # Use the clean date from listing page
-                        all_articles_data.append(article_details)
-                        seen_urls.add(article_url)
-                        time.sleep(1.5)  # Be polite, add a delay between requests
-                    else:
-                        # If parsing the full article page failed, just add what we got from listing
-                        all_articles_data.append({
-                            'title': title,
-                            'date': formatted_date,
-                            'content': 'Failed to scrape full content',
-                            'url': article_url,
-                            'source': 'Economic Times'
-                        })
-                        seen_urls.add(article_url)  # Still mark as seen
-
-                # Limit the number of articles for a quick test run
-                if len(all_articles_data) >= num_articles_limit:  # Use the passed limit
-                    print(f"Reached article limit ({num_articles_limit}) for testing, stopping.")
-                    break
-
-        if len(all_articles_data) >= num_articles_limit:
-            break  # Break out of the page_url loop too
-
-    return all_articles_data
+def scrape_economic_times_headlines(base_url, num_articles_limit=10):
+    """
+    Returns the scraped articles as a list, for callers that need all of them at once.
+    """
+    return list(iter_economic_times_articles(base_url, num_articles_limit))
 
 
 if __name__ == "__main__":
+    setup_queue_logging('scraper')
     print("Starting Economic Times news scraping...")
 
     # We will pass a dummy base_url as the function uses an internal list of URLs
     # The num_articles_limit parameter is useful for controlled testing.
-    scraped_news = scrape_economic_times_headlines(base_url='https://economictimes.indiatimes.com/news/latest-news',
-                                                   num_articles_limit=10)
-
-    if scraped_news:
-        print(f"\nScraped {len(scraped_news)} articles.")
-        for i, article in enumerate(scraped_news):
-            print(f"\n--- Article {i + 1} ---")
-            print(f"Title: {article.get('title', 'N/A')}")
-            print(f"Date: {article.get('date', 'N/A')}")
-            print(f"URL: {article.get('url', 'N/A')}")
-            print(f"Content (first 200 chars): {article.get('content', 'N/A')[:200]}...")
+    # Articles are printed as they arrive instead of after the whole batch.
+    scraped_count = 0
+    for article in iter_economic_times_articles(base_url='https://economictimes.indiatimes.com/news/latest-news',
+                                               num_articles_limit=10):
+        scraped_count += 1
+        print(f"\n--- Article {scraped_count} ---")
+        print(f"Title: {article.get('title', 'N/A')}")
+        print(f"Date: {article.get('date', 'N/A')}")
+        print(f"URL: {article.get('url', 'N/A')}")
+        print(f"Content (first 200 chars): {article.get('content', 'N/A')[:200]}...")
+
+    if scraped_count:
+        print(f"\nScraped {scraped_count} articles.")
     else:
-        print("No articles scraped or an error occurred.")
\ No newline at end of file
+        print("No articles scraped or an error occurred.")
@@ -2,22 +2,42 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import pymongo
 from datetime import datetime as dt_class, date as date_class, timedelta
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import os
+import logging
+import threading
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
 # --- Configuration ---
 load_dotenv()
 MONGO_DB_URL = os.getenv("MONGO_DB_URL", "mongodb://localhost:27017/")
 DB_NAME = "indian_market_scanner_db"
 NEWS_COLLECTION_NAME = "news_articles"
 INSIGHTS_COLLECTION_NAME = "insights"
+# Local Parquet snapshot of the insights rows; only rows from its last date on are read from MongoDB.
+# It is rebuilt from scratch whenever its row count no longer matches the collection's.
+INSIGHTS_CACHE_PATH = os.getenv("INSIGHTS_CACHE_PATH", "insights_cache.parquet")
 PAGE_TITLE = "Sentiment-Driven Indian Market Scanner"
 PAGE_ICON = "📈"
 
+# Only the fields the dashboard displays are pulled from MongoDB
+NEWS_PROJECTION = {'_id': 0, 'title': 1, 'url': 1, 'source': 1, 'publication_date': 1,
+                   'sentiment_score': 1, 'sectors_mentioned': 1}
+INSIGHTS_PROJECTION = {'_id': 0, 'date': 1, 'sector': 1, 'close': 1, 'sma_20': 1, 'sma_50': 1,
+                       'avg_sentiment': 1, 'signal': 1, 'price_to_sma_50_ratio': 1, 'beta': 1}
+
+# Documents per MongoDB round trip when loading the dashboard data
+MONGO_BATCH_SIZE = 5000
+
+# Above this many points a line trace is drawn with WebGL (Scattergl) instead of SVG
+WEBGL_MIN_POINTS = 1000
+
 # Set Streamlit page configuration
 st.set_page_config(page_title=PAGE_TITLE, page_icon=PAGE_ICON, layout="wide")
 
@@ -27,10 +47,14 @@ st.set_page_config(page_title=PAGE_TITLE, page_icon=PAGE_ICON, layout="wide")
 def get_db_collections():
     """Establishes a connection to MongoDB and returns the required collections."""
     try:
-        client = pymongo.MongoClient(MONGO_DB_URL, serverSelectionTimeoutMS=5000)
+        # Compressed wire traffic (zstd if available, zlib otherwise) and a small pool sized for
+        # Streamlit's handful of script threads
+        client = pymongo.MongoClient(MONGO_DB_URL, serverSelectionTimeoutMS=5000, compressors='zstd,zlib',
+                                     maxPoolSize=8, retryReads=True)
         db = client[DB_NAME]
         news_collection = db[NEWS_COLLECTION_NAME]
         insights_collection = db[INSIGHTS_COLLECTION_NAME]
+        # The dashboard only reads; the pipeline (database_manager.py) creates the indexes it relies on
         st.success("Successfully connected to MongoDB.")
         return news_collection, insights_collection
     except Exception as e:
@@ -39,44 +63,169 @@ def get_db_collections():
 
 
 # --- Data Fetching and Processing ---
-# --- Data Fetching and Processing ---
-@st.cache_data(ttl=3600)  # Cache data for 1 hour to prevent constant DB reads
-def fetch_and_process_data(_news_collection, _insights_collection):
-    """Fetches all necessary data and performs pre-processing for display."""
+def load_insights(insights_collection):
+    """
+    Returns the raw insights rows as a DataFrame. Rows already in the local Parquet
+    snapshot are read from disk; only rows from the snapshot's last date onwards are
+    fetched from MongoDB, and the snapshot is then rewritten with them merged in.
+
+    The last cached date is always re-read, so rows regenerated for it are picked up.
+    If the snapshot and the collection then disagree on the number of rows, rows were
+    added or removed for earlier dates too, and everything is reloaded from MongoDB.
+    """
+    cached_df = None
+    if os.path.exists(INSIGHTS_CACHE_PATH):
+        try:
+            cached_df = pd.read_parquet(INSIGHTS_CACHE_PATH)
+        except Exception:
+            cached_df = None  # Unreadable snapshot, rebuild it from MongoDB
+
+    query = {}
+    if cached_df is not None and not cached_df.empty:
+        last_cached_date = cached_df['date'].max()
+        query = {'date': {'$gte': last_cached_date.to_pydatetime()}}
+        total_rows = insights_collection.estimated_document_count()  # Collection metadata, no scan
+
+    # Build the frame straight from the cursor, in large batches, without an intermediate list
+    new_df = pd.DataFrame.from_records(
+        insights_collection.find(query, INSIGHTS_PROJECTION).batch_size(MONGO_BATCH_SIZE))
+
+    if query:
+        # The last cached date has just come back from MongoDB, so its cached rows are replaced
+        cached_df = cached_df[cached_df['date'] < last_cached_date]
+        # A mismatch (or the last date gone) means earlier dates changed as well: reload everything
+        if new_df.empty or len(cached_df) + len(new_df) != total_rows:
+            cached_df = None
+            new_df = pd.DataFrame.from_records(
+                insights_collection.find({}, INSIGHTS_PROJECTION).batch_size(MONGO_BATCH_SIZE))
+    if new_df.empty:
+        return None
 
-    news_data = list(_news_collection.find().sort("publication_date", pymongo.DESCENDING))
-    insights_data = list(_insights_collection.find().sort("date", pymongo.DESCENDING))
+    if not pd.api.types.is_datetime64_any_dtype(new_df['date']):
+        new_df['date'] = pd.to_datetime(new_df['date'])
+    insights_df = new_df if cached_df is None else pd.concat([cached_df, new_df], ignore_index=True)
 
-    if not news_data or not insights_data:
-        return None, None, None
+    # The snapshot is only a speed-up: if it can't be written (no pyarrow, read-only disk)
+    # the data is still returned. Writing to a private temp file and renaming it keeps
+    # concurrent sessions from reading or leaving behind a half-written snapshot.
+    tmp_path = f"{INSIGHTS_CACHE_PATH}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        insights_df.to_parquet(tmp_path, compression='zstd', index=False)
+        os.replace(tmp_path, INSIGHTS_CACHE_PATH)
+    except Exception as e:
+        logger.warning("Could not write the insights snapshot to %s: %s", INSIGHTS_CACHE_PATH, e)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return insights_df
 
-    news_df = pd.DataFrame(news_data).drop(columns=['_id'])
-    insights_df = pd.DataFrame(insights_data).drop(columns=['_id'])
 
-    # Convert date columns to datetime.date objects for Streamlit's slider
-    insights_df['date'] = pd.to_datetime(insights_df['date']).dt.date
-    insights_df['avg_sentiment'] = pd.to_numeric(insights_df['avg_sentiment'], errors='coerce')
-    insights_df['signal'].fillna('Neutral', inplace=True)
-    insights_df['price_to_sma_50_ratio'].fillna(insights_df['price_to_sma_50_ratio'].mean(), inplace=True)
-    insights_df['beta'].fillna(1.0, inplace=True)
+@st.cache_data(ttl=3600)  # Cache data for 1 hour to prevent constant DB reads
+def fetch_and_process_data(_news_collection, _insights_collection):
+    """Fetches all necessary data and performs pre-processing for display."""
 
-    news_df['publication_date'] = pd.to_datetime(news_df['publication_date'])
+    # Articles without any sector are never shown, so leave them on the server.
+    # No server-side sort: the news tab picks the newest rows per sector itself.
+    news_df = pd.DataFrame.from_records(
+        _news_collection.find({'sectors_mentioned.0': {'$exists': True}}, NEWS_PROJECTION)
+        .batch_size(MONGO_BATCH_SIZE))
+    insights_df = load_insights(_insights_collection)
+
+    # Without insights there is nothing to chart; missing news only leaves the news tab empty
+    if insights_df is None or insights_df.empty:
+        return None, None, None, None, None, None
+    if news_df.empty:
+        news_df = pd.DataFrame(columns=[field for field, keep in NEWS_PROJECTION.items() if keep])
+
+    # Keep dates as datetime64 (fast vectorized compares); the slider gets datetime.date values in main()
+    # PyMongo already returns BSON dates as datetimes, so only convert when they came back as something else
+    if not pd.api.types.is_datetime64_any_dtype(insights_df['date']):
+        insights_df['date'] = pd.to_datetime(insights_df['date'])
+    # A handful of sector names repeated across every row, stored once as categories
+    insights_df['sector'] = insights_df['sector'].astype('category')
+    if not pd.api.types.is_float_dtype(insights_df['avg_sentiment']):
+        insights_df['avg_sentiment'] = pd.to_numeric(insights_df['avg_sentiment'], errors='coerce')
+    # One fillna pass over the three columns (assigned back rather than filled through a column view)
+    insights_df = insights_df.fillna({
+        'signal': 'Neutral',
+        'price_to_sma_50_ratio': insights_df['price_to_sma_50_ratio'].mean(),
+        'beta': 1.0
+    })
+
+    if not pd.api.types.is_datetime64_any_dtype(news_df['publication_date']):
+        news_df['publication_date'] = pd.to_datetime(news_df['publication_date'])
+
+    # Reverse index sector -> row positions in news_df, so the news tab doesn't test every row's list
+    news_rows_by_sector = {}
+    if not news_df.empty:
+        sector_mentions = news_df['sectors_mentioned'].explode().dropna()
+        news_rows_by_sector = {sector: np.unique(rows.to_numpy())
+                               for sector, rows in sector_mentions.index.groupby(sector_mentions.to_numpy()).items()}
 
     # FIX: Explicitly filter out non-string values from the sectors list before sorting
     sectors = [s for s in insights_df['sector'].unique().tolist() if isinstance(s, str)]
     sectors = sorted(sectors)
 
-    return news_df, insights_df, sectors
+    # Per-sector rows sorted by date, so the charts look up a sector instead of re-filtering the whole frame
+    insights_by_sector = {sector: group.sort_values('date').reset_index(drop=True)
+                          for sector, group in insights_df.groupby('sector', sort=False, observed=True)}
+
+    # Positions of the Buy and Sell rows within each sector frame, for the chart's signal markers
+    signal_rows_by_sector = {}
+    for sector, sector_df in insights_by_sector.items():
+        signals = sector_df['signal'].to_numpy()
+        signal_rows_by_sector[sector] = (np.flatnonzero(signals == 'Buy'), np.flatnonzero(signals == 'Sell'))
+
+    return news_df, news_rows_by_sector, insights_df, sectors, insights_by_sector, signal_rows_by_sector
+
+
+def get_latest_signals(insights_by_sector, sectors):
+    """
+    Returns the most recent signal per sector (a Series indexed by sector), taken from
+    the same loaded insights as the charts. The per-sector frames are sorted by date,
+    so it is each one's last row.
+    """
+    return pd.Series([insights_by_sector[sector]['signal'].iloc[-1] for sector in sectors],
+                     index=sectors, dtype=object)
 
 
 # --- Visualization Functions ---
-def create_sentiment_price_chart(insights_df, selected_sector, date_range):
-    """Creates a chart with price and sentiment data overlaid."""
-    filtered_df = insights_df[
-        (insights_df['sector'] == selected_sector) &
-        (insights_df['date'] >= date_range[0]) &
-        (insights_df['date'] <= date_range[1])
-        ].copy()
+def date_range_bounds(sector_df, date_range):
+    """
+    Returns the (lo, hi) row positions of sector_df whose date falls within the slider's
+    (start, end) dates, inclusive. sector_df is sorted by date, so two binary searches suffice.
+    """
+    start = np.datetime64(date_range[0], 'ns')
+    end = np.datetime64(date_range[1], 'ns') + np.timedelta64(1, 'D')  # Include the whole end day
+    dates = sector_df['date'].to_numpy()
+    lo, hi = np.searchsorted(dates, [start, end], side='left')
+    return lo, hi
+
+
+def filter_date_range(sector_df, date_range):
+    """Returns the rows of sector_df within the slider's date range."""
+    lo, hi = date_range_bounds(sector_df, date_range)
+    return sector_df.iloc[lo:hi]
+
+
+def rows_in_bounds(rows, lo, hi):
+    """Returns the sorted row positions that fall in [lo, hi)."""
+    return rows[np.searchsorted(rows, lo):np.searchsorted(rows, hi)]
+
+
+def scatter_trace_type(num_points):
+    """Returns go.Scattergl for long series (GPU-drawn), go.Scatter for short ones."""
+    return go.Scattergl if num_points > WEBGL_MIN_POINTS else go.Scatter
+
+
+def create_sentiment_price_chart(sector_df, signal_rows, selected_sector, date_range):
+    """
+    Creates a chart with price and sentiment data overlaid.
+    signal_rows holds the precomputed (buy, sell) row positions within sector_df.
+    """
+    lo, hi = date_range_bounds(sector_df, date_range)
+    filtered_df = sector_df.iloc[lo:hi]
 
     if filtered_df.empty:
         st.warning(f"No data available for {selected_sector} in the selected date range.")
@@ -84,64 +233,58 @@ def create_sentiment_price_chart(insights_df, selected_sector, date_range):
 
     # Create figure with secondary y-axis
     fig = make_subplots(specs=[[{"secondary_y": True}]])
+    trace_type = scatter_trace_type(len(filtered_df))  # Same type for every trace in the figure
 
-    # Add Price (Close) trace on primary y-axis
-    fig.add_trace(
-        go.Scatter(
+    # Build every trace first and add them in one call, paired with the y-axis each one uses
+    traces = [
+        # Price (Close) on the primary y-axis
+        trace_type(
             x=filtered_df['date'], y=filtered_df['close'], name=f"{selected_sector} Price",
             mode='lines', line=dict(color='lightgray', width=2),
             hovertemplate="Date: %{x}<br>Price: %{y:.2f}<extra></extra>"
         ),
-        secondary_y=False,
-    )
-
-    # Add SMA traces
-    fig.add_trace(
-        go.Scatter(x=filtered_df['date'], y=filtered_df['sma_20'], name='20-Day SMA',
+        # SMA traces
+        trace_type(x=filtered_df['date'], y=filtered_df['sma_20'], name='20-Day SMA',
                    line=dict(color='orange', dash='dash')),
-        secondary_y=False
-    )
-    fig.add_trace(
-        go.Scatter(x=filtered_df['date'], y=filtered_df['sma_50'], name='50-Day SMA',
+        trace_type(x=filtered_df['date'], y=filtered_df['sma_50'], name='50-Day SMA',
                    line=dict(color='purple', dash='dash')),
-        secondary_y=False
-    )
-
-    # Add Sentiment trace on secondary y-axis
-    fig.add_trace(
-        go.Scatter(
+        # Sentiment on the secondary y-axis
+        trace_type(
             x=filtered_df['date'], y=filtered_df['avg_sentiment'], name='Avg Sentiment',
             mode='lines', line=dict(color='#1f77b4', width=2),
             hovertemplate="Date: %{x}<br>Sentiment: %{y:.2f}<extra></extra>"
         ),
-        secondary_y=True,
-    )
+    ]
+    secondary_ys = [False, False, False, True]
 
     # Add signal markers
-    buy_signals = filtered_df[filtered_df['signal'] == 'Buy']
-    sell_signals = filtered_df[filtered_df['signal'] == 'Sell']
+    buy_rows, sell_rows = signal_rows
+    buy_signals = sector_df.iloc[rows_in_bounds(buy_rows, lo, hi)]
+    sell_signals = sector_df.iloc[rows_in_bounds(sell_rows, lo, hi)]
 
     if not buy_signals.empty:
-        fig.add_trace(
-            go.Scatter(
+        traces.append(
+            trace_type(
                 x=buy_signals['date'], y=buy_signals['close'], mode='markers',
                 marker=dict(size=10, color='green', symbol='triangle-up'),
                 name='Buy Signal',
                 hovertemplate="Date: %{x}<br>Signal: Buy<extra></extra>"
-            ),
-            secondary_y=False
+            )
         )
+        secondary_ys.append(False)
 
     if not sell_signals.empty:
-        fig.add_trace(
-            go.Scatter(
+        traces.append(
+            trace_type(
                 x=sell_signals['date'], y=sell_signals['close'], mode='markers',
                 marker=dict(size=10, color='red', symbol='triangle-down'),
                 name='Sell Signal',
                 hovertemplate="Date: %{x}<br>Signal: Sell<extra></extra>"
-            ),
-            secondary_y=False
+            )
         )
+        secondary_ys.append(False)
+
+    fig.add_traces(traces, rows=1, cols=1, secondary_ys=secondary_ys)
 
     # Update layout
     fig.update_layout(
@@ -150,7 +293,8 @@ def create_sentiment_price_chart(insights_df, selected_sector, date_range):
         xaxis_title="Date",
         yaxis_title="Price (Close)",
         yaxis2_title="Sentiment Score",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        uirevision=selected_sector  # Keep zoom/legend state across reruns until the sector changes
     )
 
     # Set y-axis ranges
@@ -159,20 +303,16 @@ def create_sentiment_price_chart(insights_df, selected_sector, date_range):
     return fig
 
 
-def create_price_to_sma_50_chart(insights_df, selected_sector, date_range):
+def create_price_to_sma_50_chart(sector_df, selected_sector, date_range):
     """Creates a chart for the Price-to-SMA(50) Ratio over time."""
-    filtered_df = insights_df[
-        (insights_df['sector'] == selected_sector) &
-        (insights_df['date'] >= date_range[0]) &
-        (insights_df['date'] <= date_range[1])
-        ].copy()
+    filtered_df = filter_date_range(sector_df, date_range)
 
     if filtered_df.empty:
         return None
 
     fig = go.Figure()
     fig.add_trace(
-        go.Scatter(
+        scatter_trace_type(len(filtered_df))(
             x=filtered_df['date'], y=filtered_df['price_to_sma_50_ratio'], name="Price/SMA(50) Ratio",
             mode='lines', line=dict(color='lightgreen', width=2),
             hovertemplate="Date: %{x}<br>Price/SMA(50) Ratio: %{y:.2f}<extra></extra>"
@@ -182,29 +322,44 @@ def create_price_to_sma_50_chart(insights_df, selected_sector, date_range):
         title_text=f"Price/SMA(50) Ratio for {selected_sector}",
         xaxis_title="Date",
         yaxis_title="Ratio",
-        hovermode="x unified"
+        hovermode="x unified",
+        uirevision=selected_sector
     )
     return fig
 
 
-def display_latest_news(news_df, selected_sector, num_articles=15):
+@st.cache_data(ttl=3600)
+def get_sentiment_price_figure(_sector_df, _signal_rows, selected_sector, date_range, data_version):
+    """
+    Returns the price/sentiment chart as a plain figure dict, cached per sector and date range.
+    data_version identifies the loaded insights, so a data refresh invalidates the cache.
+    """
+    return create_sentiment_price_chart(_sector_df, _signal_rows, selected_sector, date_range).to_dict()
+
+
+@st.cache_data(ttl=3600)
+def get_price_to_sma_50_figure(_sector_df, selected_sector, date_range, data_version):
+    """Returns the Price/SMA(50) chart as a figure dict (or None), cached like the price/sentiment chart."""
+    fig = create_price_to_sma_50_chart(_sector_df, selected_sector, date_range)
+    return fig.to_dict() if fig else None
+
+
+def display_latest_news(news_df, news_rows_by_sector, selected_sector, num_articles=15):
     """Displays a table of the latest news articles for the selected sector."""
     st.subheader(f"Latest News for {selected_sector}")
 
-    # Filter news to only include the selected sector and articles with content (from APIs)
-    filtered_news_df = news_df[
-        news_df['sectors_mentioned'].apply(lambda x: selected_sector in x if isinstance(x, list) else False)
-    ].sort_values(by='publication_date', ascending=False).head(num_articles)
+    # Look up the rows mentioning the selected sector in the precomputed reverse index
+    sector_rows = news_rows_by_sector.get(selected_sector, np.array([], dtype=np.int64))
+    filtered_news_df = news_df.iloc[sector_rows].nlargest(num_articles, 'publication_date')  # Partial sort, top k only
 
     if filtered_news_df.empty:
         st.info(f"No recent news articles with content found for {selected_sector}.")
         return
 
-    # Use markdown to create a clickable link for the title
-    def create_clickable_title(row):
-        return f"[{row['title']}]({row['url']})"
-
-    filtered_news_df['title_link'] = filtered_news_df.apply(create_clickable_title, axis=1)
+    # Use markdown to create a clickable link for the title (vectorized, no per-row Python call)
+    filtered_news_df = filtered_news_df.assign(
+        title_link='[' + filtered_news_df['title'].astype(str) + '](' + filtered_news_df['url'].astype(str) + ')'
+    )
 
     # Display in a table, showing key information
     st.dataframe(
@@ -230,7 +385,8 @@ def main():
         st.stop()
 
     # Fetch and process data
-    news_df, insights_df, sectors = fetch_and_process_data(news_collection, insights_collection)
+    (news_df, news_rows_by_sector, insights_df, sectors, insights_by_sector,
+     signal_rows_by_sector) = fetch_and_process_data(news_collection, insights_collection)
     if insights_df is None or sectors is None:
         st.warning("No insights data found. Please run the full pipeline to generate insights.")
         return
@@ -241,8 +397,8 @@ def main():
         selected_sector = st.selectbox("Choose a Sector", options=sectors)
 
         # Date range slider
-        min_date = insights_df['date'].min() if not insights_df.empty else dt_class.today().date()
-        max_date = insights_df['date'].max() if not insights_df.empty else dt_class.today().date()
+        min_date = insights_df['date'].min().date() if not insights_df.empty else dt_class.today().date()
+        max_date = insights_df['date'].max().date() if not insights_df.empty else dt_class.today().date()
         date_range = st.slider(
             "Select Date Range",
             min_value=min_date,
@@ -253,26 +409,27 @@ def main():
 
         # Display latest signals as a summary in the sidebar
         st.subheader("Latest Signals")
-        latest_signals = insights_df.sort_values(by='date', ascending=False).drop_duplicates('sector', keep='first')
-
-        # Display signals in a table-like format
-        for _, row in latest_signals.iterrows():
-            signal = row['signal']
-            color = 'green' if signal == 'Buy' else 'red' if signal == 'Sell' else 'orange'
-            st.markdown(
-                f"<div style='border-left: 5px solid {color}; padding-left: 10px; margin-bottom: 5px;'><b>{row['sector']}</b>: {signal}</div>",
-                unsafe_allow_html=True
-            )
+        latest_signals = get_latest_signals(insights_by_sector, sectors)
+        # Display signals in a table-like format, sent to the browser as one markdown element
+        signal_colors = {'Buy': 'green', 'Sell': 'red'}
+        signals_html = "".join(
+            f"<div style='border-left: 5px solid {signal_colors.get(signal, 'orange')}; padding-left: 10px; margin-bottom: 5px;'><b>{sector}</b>: {signal}</div>"
+            for sector, signal in latest_signals.items()
+        )
+        st.markdown(signals_html, unsafe_allow_html=True)
 
         # New: Display latest Beta and Price/SMA(50) Ratio
         st.subheader("Latest Metrics")
-        if not latest_signals.empty:
-            latest_data = latest_signals[latest_signals['sector'] == selected_sector].iloc[0]
+        if selected_sector in insights_by_sector:
+            latest_data = insights_by_sector[selected_sector].iloc[-1]  # Frames are sorted by date
             st.markdown(f"**Beta**: `{latest_data['beta']:.2f}`")
             st.markdown(f"**Price/SMA(50) Ratio**: `{latest_data['price_to_sma_50_ratio']:.2f}`")
 
     # --- Main Content Area ---
     if selected_sector:
+        sector_df = insights_by_sector[selected_sector]
+        data_version = f"{max_date}:{len(insights_df)}"  # Changes whenever new insights are loaded
+
         # Create and display the price/sentiment chart
         st.subheader(f"Dashboard for {selected_sector}")
 
@@ -281,18 +438,19 @@ def main():
 
         with tab1:
             st.header("Price & Sentiment Analysis")
-            fig_price_sentiment = create_sentiment_price_chart(insights_df, selected_sector, date_range)
-            st.plotly_chart(fig_price_sentiment, use_container_width=True)
+            fig_price_sentiment = get_sentiment_price_figure(sector_df, signal_rows_by_sector[selected_sector],
+                                                             selected_sector, date_range, data_version)
+            st.plotly_chart(fig_price_sentiment, use_container_width=True, key="price_sentiment_chart")
 
         with tab2:
             st.header("Fundamental Analysis")
-            fig_pb = create_price_to_sma_50_chart(insights_df, selected_sector, date_range)
+            fig_pb = get_price_to_sma_50_figure(sector_df, selected_sector, date_range, data_version)
             if fig_pb:
-                st.plotly_chart(fig_pb, use_container_width=True)
+                st.plotly_chart(fig_pb, use_container_width=True, key="price_to_sma_50_chart")
 
         with tab3:
             st.header("Latest News Headlines")
-            display_latest_news(news_df, selected_sector, num_articles=15)
+            display_latest_news(news_df, news_rows_by_sector, selected_sector, num_articles=15)
 
     st.markdown("---")
     st.info(
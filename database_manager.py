@@ -1,23 +1,34 @@
 # --- All Imports at the Top ---
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 import requests
-import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
-from datetime import datetime as dt_class, date as date_class, timedelta
+import math
+from datetime import datetime as dt_class, date as date_class, timedelta, timezone
 import pymongo
-from pymongo.errors import ConnectionFailure, DuplicateKeyError
+from pymongo import IndexModel
+from pymongo.errors import ConnectionFailure
 
+import ijson
+import orjson
 import os
 from dotenv import load_dotenv
 
 # Import NLP processing functions from the new file
-from nlp_processor import process_and_update_sentiment, process_and_update_entities
+from nlp_processor import process_and_update_sentiment, process_and_update_entities, annotate_articles
 
 # Import market data functions from the new file, aliasing the connect function
 from market_data_collector import connect_to_mongodb as connect_to_market_data_mongodb, fetch_historical_market_data
 from insights_generator import generate_and_store_insights
 
-# Import ET scraping function from et_news_scraper.py
+from utils import RateLimiter, setup_queue_logging
+
+# Import the ET scraper, plus the article shape and MongoDB write helpers it shares with the API fetchers
 from et_news_scraper import scrape_economic_times_headlines
+from news_store import (normalize_article, get_latest_news_date, find_existing_urls, build_insert_op,
+                        flush_insert_ops)
 
 # --- Load Environment Variables ---
 load_dotenv()
@@ -30,93 +41,63 @@ MARKETAUX_API_KEY = os.getenv('MARKETAUX_API_KEY')
 FINNHUB_NEWS_BASE_URL = 'https://finnhub.io/api/v1/news'
 MARKETAUX_NEWS_BASE_URL = 'https://api.marketaux.com/v1/news/all'
 
-
-# --- Helper Function for Caching (for news) ---
-def get_latest_news_date(mongo_collection, source_name):
+# Finnhub news is kept only if the headline or summary mentions one of these
+# whole words. One compiled alternation replaces a Python loop over the keywords.
+INDIAN_KEYWORDS = ('india', 'indian', 'nifty', 'sensex', 'rbi', 'nse', 'bse', 'mumbai', 'delhi', 'adani',
+                   'reliance', 'tata', 'infosys', 'sbi', 'icici', 'hdfc')
+_INDIAN_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, INDIAN_KEYWORDS)) + r')\b', re.IGNORECASE)
+
+# Marketaux returns at most this many articles per page (adjust based on your plan);
+# the pages needed for an article limit are fetched in parallel, a few at a time.
+MARKETAUX_PAGE_SIZE = 100
+MARKETAUX_MAX_PARALLEL_PAGES = 4
+
+# Articles are queued, run through NLP and upserted in batches of this size
+BULK_WRITE_BATCH_SIZE = 100
+
+# --- Shared HTTP Session ---
+# Reused for every Finnhub/Marketaux call so keep-alive connections are pooled
+# instead of opening a new TCP+TLS connection per request.
+API_SESSION = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=20,
+    # pool_block caps concurrent requests to each API host at pool_maxsize; extra threads wait for a free connection
+    pool_maxsize=4,
+    pool_block=True,
+    # Throttling (429/503) is retried after the server's Retry-After, otherwise with 0.5s/1s/2s backoff
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                      respect_retry_after_header=True)
+)
+# Same pool and retry policy whichever scheme a URL uses
+API_SESSION.mount('https://', _http_adapter)
+API_SESSION.mount('http://', _http_adapter)
+
+# One limiter per API host: at most `rate` requests per second, in bursts of up to `capacity`.
+# Marketaux's burst covers the pages that are fetched in parallel.
+FINNHUB_RATE_LIMITER = RateLimiter(rate=1.0, capacity=1)
+MARKETAUX_RATE_LIMITER = RateLimiter(rate=2.0, capacity=MARKETAUX_MAX_PARALLEL_PAGES)
+
+
+# --- Core MongoDB Insertion Functions ---
+def flush_articles(collection, articles):
     """
-    Retrieves the latest publication_date for a given source from MongoDB.
-    Returns datetime object or None if no data found.
+    Runs sentiment and entity extraction over the queued articles in one batch, then
+    inserts them with flush_insert_ops. Clears the list and returns the number written.
     """
-    if mongo_collection is None:
-        return None
-
-    latest_article = mongo_collection.find(
-        {"source": source_name, "publication_date": {"$ne": None}}
-    ).sort("publication_date", pymongo.DESCENDING).limit(1)
-
-    try:
-        latest = latest_article.next()
-        if isinstance(latest.get('publication_date'), dt_class):
-            return latest['publication_date']
-        elif isinstance(latest.get('publication_date'), str):
-            try:
-                return dt_class.strptime(latest['publication_date'], '%Y-%m-%d')
-            except ValueError:
-                return None
-        return None
-    except StopIteration:
-        return None
+    annotate_articles(articles)
+    written = flush_insert_ops(collection, [build_insert_op(article) for article in articles])
+    articles.clear()
+    return written
 
 
-# --- Core MongoDB Insertion Function (Stays in main file as a core utility) ---
-def insert_article_into_mongodb(collection, article_data):
+def drop_stored_articles(collection, articles):
     """
-    Inserts a single news article document into the MongoDB collection.
-    Uses update_one with upsert=True to insert if not exists, or update if exists.
+    Removes the articles whose URL is already in MongoDB from the list, in place,
+    with one $in lookup for the whole batch.
     """
-    if collection is None:
-        print("MongoDB collection not available. Skipping insertion.")
-        return False
-
-    if 'date' in article_data and isinstance(article_data['date'], str):
-        try:
-            parsed_date = dt_class.strptime(article_data['date'], '%Y-%m-%d')
-            article_data['publication_date'] = parsed_date
-        except ValueError:
-            print(f"Warning: Could not parse date '{article_data['date']}' into datetime object. Storing as string.")
-            article_data['publication_date'] = article_data['date']
-        article_data.pop('date', None)
-
-    article_data.setdefault('sentiment_score', None)
-    article_data.setdefault('companies_mentioned', [])
-    article_data.setdefault('sectors_mentioned', [])
-
-    try:
-        result = collection.update_one(
-            {'url': article_data['url']},
-            {
-                '$set': {
-                    'title': article_data.get('title'),
-                    'content': article_data.get('content'),
-                    'publication_date': article_data.get('publication_date'),
-                    'source': article_data.get('source'),
-                    'sentiment_score': article_data.get('sentiment_score'),
-                    'companies_mentioned': article_data.get('companies_mentioned'),
-                    'sectors_mentioned': article_data.get('sectors_mentioned')
-                }
-            },
-            upsert=True
-        )
-
-        if result.upserted_id:
-            print(f"Inserted new article: {article_data['title'][:50]}... (ID: {result.upserted_id})")
-            return True
-        elif result.matched_count > 0 and result.modified_count == 0:
-            print(f"Article already exists (URL: {article_data['url']}). No new insert or update needed.")
-            return False
-        elif result.matched_count > 0 and result.modified_count > 0:
-            print(f"Existing article (URL: {article_data['url']}) updated.")
-            return True
-        else:
-            print(f"MongoDB operation for URL {article_data['url']} neither inserted nor updated. Check logic.")
-            return False
-
-    except DuplicateKeyError:
-        print(f"Duplicate key error for URL: {article_data['url']}. Article already exists.")
-        return False
-    except Exception as e:
-        print(f"Error inserting/updating article {article_data.get('url', 'N/A')}: {e}")
-        return False
+    existing_urls = find_existing_urls(collection, [article['url'] for article in articles])
+    if existing_urls:
+        articles[:] = [article for article in articles if article['url'] not in existing_urls]
 
 
 # --- News API Fetching Functions ---
@@ -145,82 +126,115 @@ def fetch_news_from_finnhub(api_key, mongo_collection, num_articles_limit=15):
         print(f"Skipping Finnhub fetch: From date {from_date_str} is in the future.")
         return []
 
+    window_from_str = from_date_str if from_date_str else (dt_class.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+
     categories = ['general']
     all_fetched_articles = []
+    pending_articles = []
+    # URLs already queued in this run; the ones stored by earlier runs are dropped per batch
+    seen_urls = set()
     processed_count = 0
 
-    indian_keywords = ['india', 'indian', 'nifty', 'sensex', 'rbi', 'nse', 'bse', 'mumbai', 'delhi', 'adani',
-                       'reliance', 'tata', 'infosys', 'sbi', 'icici', 'hdfc']
-
     for category in categories:
         params = {
             'category': category,
             'token': api_key,
-            'from': from_date_str if from_date_str else (dt_class.now() - timedelta(days=7)).strftime('%Y-%m-%d'),
+            'from': window_from_str,
             'to': to_date_str
         }
 
         response = None
         try:
             print(f"Fetching {category} news from Finnhub (from {params['from']} to {params['to']})...")
-            time.sleep(0.5)
-            response = requests.get(FINNHUB_NEWS_BASE_URL, params=params, timeout=15)
+            FINNHUB_RATE_LIMITER.acquire()
+            # Stream the JSON array so items are filtered as they arrive instead of
+            # materialising the whole feed first; hitting the limit stops the download.
+            response = API_SESSION.get(FINNHUB_NEWS_BASE_URL, params=params, stream=True, timeout=15)
             response.raise_for_status()
-            news_items = response.json()
-            print(f"Fetched {len(news_items)} news items from Finnhub for category '{category}'.")
-
-            for item in news_items:
-                title_lower = item.get('headline', '').lower()
-                summary_lower = item.get('summary', '').lower()
+            response.raw.decode_content = True
+            fetched_count = 0
 
-                is_indian_context = False
-                for keyword in indian_keywords:
-                    if keyword in title_lower or keyword in summary_lower:
-                        is_indian_context = True
-                        break
-
-                if not is_indian_context:
+            for item in ijson.items(response.raw, 'item'):
+                fetched_count += 1
+                if not _INDIAN_RE.search(f"{item.get('headline') or ''} {item.get('summary') or ''}"):
                     continue
 
-                article_data = {
-                    'title': item.get('headline'),
-                    'content': item.get('summary'),
-                    'url': item.get('url'),
-                    'publication_date': dt_class.fromtimestamp(item.get('datetime', 0)).strftime('%Y-%m-%d'),
-                    'source': "Finnhub",
-                    'sentiment_score': None,
-                    'companies_mentioned': [],
-                    'sectors_mentioned': []
-                }
+                article_data = normalize_article(
+                    title=item.get('headline'),
+                    content=item.get('summary'),
+                    url=item.get('url'),
+                    # Stored as a BSON date (naive UTC, as pymongo reads it back), not a formatted string
+                    publication_date=dt_class.fromtimestamp(item.get('datetime', 0), timezone.utc).replace(tzinfo=None),
+                    source="Finnhub"
+                )
 
                 if not article_data['url'] or not article_data['title'] or not article_data['content']:
                     print(
                         f"Skipping article due to missing crucial data from Finnhub: {article_data.get('url', 'N/A')}")
                     continue
 
-                inserted = insert_article_into_mongodb(mongo_collection, article_data)
-                if inserted:
-                    all_fetched_articles.append(article_data)
-                    processed_count += 1
+                # The same story came back under another category
+                if article_data['url'] in seen_urls:
+                    continue
+                seen_urls.add(article_data['url'])
 
-                if processed_count >= num_articles_limit:
-                    print(f"Reached article limit ({num_articles_limit}) for Finnhub news, stopping.")
-                    return all_fetched_articles
+                pending_articles.append(article_data)
+                # Flush once the batch is full, or as soon as it could reach the limit. Articles
+                # that are already stored are dropped first and don't count towards the limit.
+                if len(pending_articles) >= min(BULK_WRITE_BATCH_SIZE,
+                                                num_articles_limit - len(all_fetched_articles)):
+                    drop_stored_articles(mongo_collection, pending_articles)
+                    all_fetched_articles.extend(pending_articles)
+                    processed_count += flush_articles(mongo_collection, pending_articles)
 
-            time.sleep(0.5)
+                    if len(all_fetched_articles) >= num_articles_limit:
+                        print(f"Reached article limit ({num_articles_limit}) for Finnhub news, stopping.")
+                        return all_fetched_articles
+
+            print(f"Fetched {fetched_count} news items from Finnhub for category '{category}'.")
 
         except requests.exceptions.RequestException as e:
-            error_response_content = response.text[:200] if response is not None and hasattr(response,
-                                                                                             'text') else 'N/A'
+            # The body may already be partly consumed by ijson, so response.text is off limits here
+            status_code = response.status_code if response is not None else 'N/A'
             print(f"Error fetching news from Finnhub API for category '{category}': {e}")
-            print(f"Response content: {error_response_content}")
+            print(f"Response status: {status_code}")
         except Exception as e:
             print(f"An unexpected error occurred processing Finnhub news for category '{category}': {e}")
-
-    print(f"Finnhub news collection complete. Inserted {processed_count} new/updated articles.")
+        finally:
+            # Streamed responses hold their connection until closed
+            if response is not None:
+                response.close()
+
+    drop_stored_articles(mongo_collection, pending_articles)
+    all_fetched_articles.extend(pending_articles)
+    processed_count += flush_articles(mongo_collection, pending_articles)
+    print(f"Finnhub news collection complete. Inserted {processed_count} new articles.")
     return all_fetched_articles
 
 
+def fetch_marketaux_page(params, page):
+    """
+    Fetches one page of Marketaux results and returns its news items. A failed
+    page is reported and comes back empty, so it does not lose the other pages.
+    """
+    response = None
+    try:
+        MARKETAUX_RATE_LIMITER.acquire()
+        response = API_SESSION.get(MARKETAUX_NEWS_BASE_URL, params={**params, 'page': page}, timeout=15)
+        response.raise_for_status()
+        # orjson decodes the raw body faster than response.json(), which goes through the stdlib json
+        payload = orjson.loads(response.content)
+        if not isinstance(payload, dict) or not isinstance(payload.get('data', []), list):
+            print(f"Unexpected response for page {page} from Marketaux API: {response.text[:200]}")
+            return []
+        return payload.get('data', [])
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+        error_response_content = response.text[:200] if response is not None else 'N/A'
+        print(f"Error fetching page {page} of news from Marketaux API: {e}")
+        print(f"Response content: {error_response_content}")
+        return []
+
+
 def fetch_news_from_marketaux(api_key, mongo_collection, num_articles_limit=15):
     """
     Fetches financial news from Marketaux API, filters for Indian context,
@@ -248,76 +262,108 @@ def fetch_news_from_marketaux(api_key, mongo_collection, num_articles_limit=15):
         return []
 
     all_fetched_articles = []
+    pending_articles = []
+    seen_urls = set()
     processed_count = 0
 
     params = {
         'api_token': api_key,
         'countries': 'in',
-        'limit': 100,  # Max number of articles per request (adjust based on your plan)
+        'limit': MARKETAUX_PAGE_SIZE,
         'sort': 'published_desc',
         'published_after': published_after_date_str
     }
+    total_pages = math.ceil(num_articles_limit / MARKETAUX_PAGE_SIZE)
 
-    response = None
     try:
         print(
-            f"Fetching news from Marketaux (published after {params['published_after'] if 'published_after' in params else 'start'})...")
-        time.sleep(0.5)
-        response = requests.get(MARKETAUX_NEWS_BASE_URL, params=params, timeout=15)
-        response.raise_for_status()
-
-        json_data = response.json()
-        news_items = json_data.get('data', [])
+            f"Fetching {total_pages} page(s) of news from Marketaux (published after {params['published_after']})...")
+        # Pages are independent, so they are requested together instead of one RTT after another
+        with ThreadPoolExecutor(max_workers=min(total_pages, MARKETAUX_MAX_PARALLEL_PAGES)) as executor:
+            pages = list(executor.map(lambda page: fetch_marketaux_page(params, page), range(1, total_pages + 1)))
+        news_items = [item for page_items in pages for item in page_items]
 
         print(f"Fetched {len(news_items)} news items from Marketaux.")
 
+        # The whole result set is already here, so one chunked $in lookup finds the
+        # articles already in the DB; they are treated as seen and skipped outright
+        seen_urls = find_existing_urls(mongo_collection, [item['url'] for item in news_items if item.get('url')])
+
         for item in news_items:
-            published_date_str = None
+            published_date = None
             if item.get('published_at'):
                 try:
-                    dt_object = dt_class.fromisoformat(item['published_at'].replace('Z', '+00:00'))
-                    published_date_str = dt_object.strftime('%Y-%m-%d')
+                    # Marketaux timestamps are UTC ("...T10:00:00.000000Z"); the seconds-precision
+                    # prefix parses straight into the naive UTC datetime stored as a BSON date
+                    published_date = dt_class.fromisoformat(item['published_at'][:19])
                 except ValueError:
                     print(f"Warning: Could not parse Marketaux date '{item['published_at']}'. Storing as raw string.")
-                    published_date_str = item['published_at']
-
-            article_data = {
-                'title': item.get('title'),
-                'content': item.get('description'),
-                'url': item.get('url'),
-                'publication_date': published_date_str,
-                'source': "Marketaux",
-                'sentiment_score': None,
-                'companies_mentioned': [],
-                'sectors_mentioned': []
-            }
+                    published_date = item['published_at']
+
+            article_data = normalize_article(
+                title=item.get('title'),
+                content=item.get('description'),
+                url=item.get('url'),
+                publication_date=published_date,
+                source="Marketaux"
+            )
 
             if not article_data['url'] or not article_data['title'] or not article_data['content']:
                 print(f"Skipping article due to missing crucial data from Marketaux: {article_data.get('url', 'N/A')}")
                 continue
 
-            inserted = insert_article_into_mongodb(mongo_collection, article_data)
-            if inserted:
-                all_fetched_articles.append(article_data)
-                processed_count += 1
+            if article_data['url'] in seen_urls:
+                continue
+            seen_urls.add(article_data['url'])
 
-            if processed_count >= num_articles_limit:
-                print(f"Reached article limit ({num_articles_limit}) for Marketaux news, stopping.")
-                return all_fetched_articles
+            pending_articles.append(article_data)
+            all_fetched_articles.append(article_data)
+            if len(pending_articles) >= BULK_WRITE_BATCH_SIZE:
+                processed_count += flush_articles(mongo_collection, pending_articles)
 
-        time.sleep(0.5)
+            if len(all_fetched_articles) >= num_articles_limit:
+                print(f"Reached article limit ({num_articles_limit}) for Marketaux news, stopping.")
+                break
 
-    except requests.exceptions.RequestException as e:
-        error_response_content = response.text[:200] if response is not None and hasattr(response, 'text') else 'N/A'
-        print(f"Error fetching news from Marketaux API: {e}")
-        print(f"Response content: {error_response_content}")
     except Exception as e:
         print(f"An unexpected error occurred processing Marketaux news: {e}")
 
-    print(f"Marketaux news collection complete. Inserted {processed_count} new/updated articles.")
+    processed_count += flush_articles(mongo_collection, pending_articles)
+    print(f"Marketaux news collection complete. Inserted {processed_count} new articles.")
     return all_fetched_articles
 
 
+# Indexes on the news collection. The NLP phases look for documents that are still
+# missing a sentiment score or entities, and the dashboard sorts by date; indexes keep
+# those from scanning the whole collection.
+NEWS_INDEXES = [
+    IndexModel([("url", pymongo.ASCENDING)], unique=True),
+    IndexModel([("sentiment_score", pymongo.ASCENDING)]),
+    IndexModel([("companies_mentioned", pymongo.ASCENDING)]),
+    IndexModel([("sectors_mentioned", pymongo.ASCENDING)]),
+    IndexModel([("publication_date", pymongo.DESCENDING)]),
+    # Per-source lookup at the start of every fetch: the newest article of a source
+    # (served in index order, no sort)
+    IndexModel([("source", pymongo.ASCENDING), ("publication_date", pymongo.DESCENDING)]),
+]
+
+# The dashboard reads the insights per sector in date order
+INSIGHTS_INDEXES = [
+    IndexModel([("sector", pymongo.ASCENDING), ("date", pymongo.DESCENDING)]),
+]
+
+
+def ensure_indexes(collection, indexes):
+    """
+    Creates whichever of the given indexes the collection doesn't have yet: one listIndexes
+    round trip, then a single createIndexes, instead of a create_index call per index.
+    """
+    existing_indexes = collection.index_information()
+    missing_indexes = [index for index in indexes if index.document['name'] not in existing_indexes]
+    if missing_indexes:
+        collection.create_indexes(missing_indexes)
+
+
 def connect_to_mongodb(host='localhost', port=27017, db_name='indian_market_scanner_db',
                        collection_name='news_articles'):
     """
@@ -330,8 +376,8 @@ def connect_to_mongodb(host='localhost', port=27017, db_name='indian_market_scan
         db = client[db_name]
         collection = db[collection_name]
 
-        collection.create_index([("url", pymongo.ASCENDING)], unique=True)
-        print(f"Ensured unique index on 'url' for collection '{collection_name}'")
+        ensure_indexes(collection, NEWS_INDEXES)
+        print(f"Ensured unique index on 'url' and query indexes for collection '{collection_name}'")
 
         return collection
     except ConnectionFailure as e:
@@ -342,18 +388,16 @@ def connect_to_mongodb(host='localhost', port=27017, db_name='indian_market_scan
         return None
 
 
-def get_latest_news_date_for_et(mongo_collection, source_name):
-    # This helper is needed locally for ET scraper
-    return get_latest_news_date(mongo_collection, source_name)
-
-
-def insert_article_into_mongodb_for_et(mongo_collection, article_data):
-    # This helper is needed locally for ET scraper
-    return insert_article_into_mongodb(mongo_collection, article_data)
-
-
 # --- Main Execution Block ---
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Collect news and market data, then run NLP and insights.")
+    parser.add_argument('--skip-et', action='store_true',
+                        help="Don't scrape the Economic Times listing pages; only collect from the news APIs.")
+    args = parser.parse_args()
+
+    # The ET scraper and the shared MongoDB write helpers log through their own loggers
+    setup_queue_logging('et_scraper', 'news_store')
+
     print("Starting news and market data processing pipeline...")
 
     if not FINNHUB_API_KEY:
@@ -371,55 +415,86 @@ if __name__ == "__main__":
     if mongo_news_collection is not None and mongo_market_data_collection is not None:
         print("\nAll MongoDB connections established. Proceeding with data collection and processing.")
 
-        print("\n--- Phase 1 & 2: Data Collection via Economic Times Scraper ---")
-        et_scraped_summary = scrape_economic_times_headlines(
-            mongo_collection=mongo_news_collection,
-            num_articles_limit=15
-        )
-        if et_scraped_summary:
-            print(f"\nEconomic Times scraping complete. Processed {len(et_scraped_summary)} articles.")
-        else:
-            print("No new articles scraped from Economic Times or an error occurred.")
-
-        print("\n--- Phase 1 & 2: Data Collection via Finnhub API ---")
-        finnhub_news_summary = fetch_news_from_finnhub(
-            api_key=FINNHUB_API_KEY,
-            mongo_collection=mongo_news_collection,
-            num_articles_limit=20
-        )
-        if finnhub_news_summary:
-            print(f"\nFinnhub news collection complete. Processed {len(finnhub_news_summary)} articles.")
+        # The sources are independent and mostly waiting on the network, so they are
+        # collected concurrently; yfinance market data has nothing to do with the news
+        # and runs alongside them. NLP and insights below need all of it in place first.
+        print("\n--- Phase 1 & 2: Data Collection (ET, Finnhub, Marketaux and market data in parallel) ---")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            et_future = None
+            if not args.skip_et:
+                et_future = executor.submit(
+                    scrape_economic_times_headlines,
+                    mongo_collection=mongo_news_collection,
+                    num_articles_limit=15
+                )
+            finnhub_future = executor.submit(
+                fetch_news_from_finnhub,
+                api_key=FINNHUB_API_KEY,
+                mongo_collection=mongo_news_collection,
+                num_articles_limit=20
+            )
+            marketaux_future = executor.submit(
+                fetch_news_from_marketaux,
+                api_key=MARKETAUX_API_KEY,
+                mongo_collection=mongo_news_collection,
+                num_articles_limit=20
+            )
+            market_data_future = executor.submit(
+                fetch_historical_market_data,
+                mongo_collection=mongo_market_data_collection
+            )
+
+        # Each source is reported on its own, so one failing feed doesn't hide the others' results
+        if et_future is None:
+            print("\nSkipped Economic Times scraper (--skip-et).")
         else:
-            print("No new articles fetched from Finnhub or an error occurred during collection.")
-
-        print("\n--- Phase 1 & 2: Data Collection via Marketaux API ---")
-        marketaux_news_summary = fetch_news_from_marketaux(
-            api_key=MARKETAUX_API_KEY,
-            mongo_collection=mongo_news_collection,
-            num_articles_limit=20
-        )
-        if marketaux_news_summary:
-            print(f"\nMarketaux news collection complete. Processed {len(marketaux_news_summary)} articles.")
-        else:
-            print("No new articles fetched from Marketaux or an error occurred during collection.")
+            try:
+                et_scraped_summary = et_future.result()
+                if et_scraped_summary:
+                    print(f"\nEconomic Times scraping complete. Processed {len(et_scraped_summary)} articles.")
+                else:
+                    print("No new articles scraped from Economic Times or an error occurred.")
+            except Exception as e:
+                print(f"\nEconomic Times scraping failed: {e}")
 
-        print("\n--- Phase 3: NLP Processing (Sentiment & Entity Recognition) ---")
+        try:
+            finnhub_news_summary = finnhub_future.result()
+            if finnhub_news_summary:
+                print(f"\nFinnhub news collection complete. Processed {len(finnhub_news_summary)} articles.")
+            else:
+                print("No new articles fetched from Finnhub or an error occurred during collection.")
+        except Exception as e:
+            print(f"\nFinnhub news collection failed: {e}")
+
+        try:
+            marketaux_news_summary = marketaux_future.result()
+            if marketaux_news_summary:
+                print(f"\nMarketaux news collection complete. Processed {len(marketaux_news_summary)} articles.")
+            else:
+                print("No new articles fetched from Marketaux or an error occurred during collection.")
+        except Exception as e:
+            print(f"\nMarketaux news collection failed: {e}")
+
+        try:
+            market_data_future.result()
+            # The fetch_historical_market_data function now prints its own summary
+            print("\nSuccessfully collected historical market data records.")
+        except Exception as e:
+            print(f"\nHistorical market data collection failed: {e}")
+
+        # API articles are scored and tagged as they are ingested; these passes only
+        # pick up documents still missing the fields (e.g. ET metadata, older rows).
+        print("\n--- Phase 3: NLP Backfill (Sentiment & Entity Recognition) ---")
         process_and_update_sentiment(mongo_news_collection)
 
         print("\n--- Phase 3b: Entity and Sector Recognition ---")
         process_and_update_entities(mongo_news_collection)
 
-        print("\n--- Phase 4: Historical Market Data ---")
-        fetch_historical_market_data(
-            mongo_collection=mongo_market_data_collection
-        )
-        # The fetch_historical_market_data function now prints its own summary
-        print("\nSuccessfully collected historical market data records.")
-
-        print("\n--- Phase 5: Generating Correlation and Insights ---")
+        print("\n--- Phase 4: Generating Correlation and Insights ---")
         try:
             # Re-establish insights collection here to avoid global variable issues
             mongo_insights_collection = pymongo.MongoClient("mongodb://localhost:27017/")["indian_market_scanner_db"]["insights"]
+            ensure_indexes(mongo_insights_collection, INSIGHTS_INDEXES)
             generate_and_store_insights(mongo_news_collection, mongo_market_data_collection, mongo_insights_collection)
         except TypeError as e:
             print(f"Error during insights generation: {e}. Check the generate_and_store_insights function signature.")
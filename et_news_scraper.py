@@ -1,175 +1,120 @@
 # et_news_scraper.py
 
 import requests
-from bs4 import BeautifulSoup
-import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
 import re
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime as dt_class, date as date_class, timedelta
-import pymongo
-from pymongo.errors import ConnectionFailure, DuplicateKeyError
+from pymongo.errors import ConnectionFailure
+from news_store import (normalize_article, get_latest_news_date, find_existing_urls, build_insert_op,
+                        flush_insert_ops)
 
-
-# --- Helper Functions for Caching/Insertion (Local to this file) ---
-def get_latest_news_date(mongo_collection, source_name):
-    """
-    Retrieves the latest publication_date for a given source from MongoDB.
-    Returns datetime object or None if no data found.
-    """
-    if mongo_collection is None:
-        return None
-
-    latest_article = mongo_collection.find(
-        {"source": source_name, "publication_date": {"$ne": None}}
-    ).sort("publication_date", pymongo.DESCENDING).limit(1)
-
-    try:
-        latest = latest_article.next()
-        if isinstance(latest.get('publication_date'), dt_class):
-            return latest['publication_date']
-        elif isinstance(latest.get('publication_date'), str):
-            try:
-                return dt_class.strptime(latest['publication_date'], '%Y-%m-%d')
-            except ValueError:
-                return None
-        return None
-    except StopIteration:
-        return None
+# --- Logging ---
+# Per-article detail is logged at DEBUG, so the default INFO output stays short.
+# Entry points route this logger through the shared queue with setup_queue_logging.
+logger = logging.getLogger('et_scraper')
+logger.setLevel(logging.INFO)
 
 
-def insert_article_into_mongodb(collection, article_data):
+# --- Web Scraping Helper Functions (Specific to ET structure) ---
+# One keep-alive session for the whole run so repeated requests to ET reuse
+# pooled connections instead of paying a new TCP+TLS handshake each time.
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+_http_adapter = HTTPAdapter(
+    pool_connections=20,
+    # pool_block caps concurrent requests to ET at pool_maxsize; extra threads wait for a free connection
+    pool_maxsize=8,
+    pool_block=True,
+    # Throttling (429/503) is retried after the server's Retry-After, otherwise with 0.5s/1s/2s backoff
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                      respect_retry_after_header=True)
+)
+# Same pool and retry policy whichever scheme a URL uses
+SESSION.mount('https://', _http_adapter)
+SESSION.mount('http://', _http_adapter)
+
+
+# Selectors for the news items on the listing pages
+LINK_XPATH = etree.XPath('.//a[@href]')
+TIMESTAMP_XPATH = etree.XPath(
+    ".//span[contains(concat(' ', normalize-space(@class), ' '), ' timestamp ')]"
+)
+
+# "Aug 1, 2025" and "1 Aug 2025" style dates as one alternation, so each string is scanned once.
+# The named group that matched tells which strptime format applies.
+_MONTHS = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)'
+_DISPLAY_DATE_RE = re.compile(rf'(?P<mdy>\b{_MONTHS}\s+\d{{1,2}},\s+\d{{4}})|(?P<dmy>\d{{1,2}}\s+{_MONTHS}\s+\d{{4}})')
+_DISPLAY_DATE_FORMATS = {'mdy': '%b %d, %Y', 'dmy': '%d %b %Y'}
+
+
+def _find_display_date(text):
     """
-    Inserts a single news article document into the MongoDB collection.
-    Uses update_one with upsert=True to insert if not exists, or update if exists.
+    Returns (date string, strptime format) for the first displayed date in text, or (None, None).
     """
-    if collection is None:
-        print("MongoDB collection not available. Skipping insertion.")
-        return False
-
-    if 'date' in article_data and isinstance(article_data['date'], str):
-        try:
-            parsed_date = dt_class.strptime(article_data['date'], '%Y-%m-%d')
-            article_data['publication_date'] = parsed_date
-        except ValueError:
-            print(f"Warning: Could not parse date '{article_data['date']}' into datetime object. Storing as string.")
-            article_data['publication_date'] = article_data['date']
-        article_data.pop('date', None)
-
-    article_data.setdefault('sentiment_score', None)
-    article_data.setdefault('companies_mentioned', [])
-    article_data.setdefault('sectors_mentioned', [])
-
-    try:
-        result = collection.update_one(
-            {'url': article_data['url']},
-            {
-                '$set': {
-                    'title': article_data.get('title'),
-                    'content': article_data.get('content'),
-                    'publication_date': article_data.get('publication_date'),
-                    'source': article_data.get('source'),
-                    'sentiment_score': article_data.get('sentiment_score'),
-                    'companies_mentioned': article_data.get('companies_mentioned'),
-                    'sectors_mentioned': article_data.get('sectors_mentioned')
-                }
-            },
-            upsert=True
-        )
-
-        if result.upserted_id:
-            print(f"Inserted new article: {article_data['title'][:50]}... (ID: {result.upserted_id})")
-            return True
-        elif result.matched_count > 0 and result.modified_count == 0:
-            print(f"Article already exists (URL: {article_data['url']}). No new insert or update needed.")
-            return False
-        elif result.matched_count > 0 and result.modified_count > 0:
-            print(f"Existing article (URL: {article_data['url']}) updated.")
-            return True
-        else:
-            print(f"MongoDB operation for URL {article_data['url']} neither inserted nor updated. Check logic.")
-            return False
-
-    except DuplicateKeyError:
-        print(f"Duplicate key error for URL: {article_data['url']}. Article already exists.")
-        return False
-    except Exception as e:
-        print(f"Error inserting/updating article {article_data.get('url', 'N/A')}: {e}")
-        return False
+    match = _DISPLAY_DATE_RE.search(text)
+    if match is None:
+        return None, None
+    return match.group(0), _DISPLAY_DATE_FORMATS[match.lastgroup]
 
 
-# --- Web Scraping Helper Functions (Specific to ET structure) ---
-def get_html_content(url, retries=3, delay=2):
+def _read_listing_items(parser, items):
     """
-    Fetches the HTML content of a given URL with retries and delays.
+    Collects the news items whose <li> the pull parser has finished since the last call.
+    Each one is reduced to (title, href, data-time, displayed date) and then cleared.
+    data-time is '' when the timestamp doesn't carry one, so the displayed date is used.
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    for i in range(retries):
-        try:
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            return response.content
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching {url}: {e}")
-            if i < retries - 1:
-                print(f"Retrying in {delay} seconds...")
-                time.sleep(delay)
-            else:
-                print(f"Failed to fetch {url} after {retries} attempts.")
-                return None
-    return None
-
-
-def parse_article_page(article_url):
+    for _, li in parser.read_events():
+        parent = li.getparent()
+        if not (li.get('itemprop') == 'itemListElement' and parent is not None and parent.tag == 'ul'
+                and 'data' in (parent.get('class') or '').split()):
+            continue  # Not a news item (menus, nested lists): leave it alone
+
+        links = LINK_XPATH(li)
+        timestamps = TIMESTAMP_XPATH(li)
+        if links and timestamps:
+            items.append((
+                ''.join(links[0].itertext()).strip(),
+                links[0].get('href'),
+                timestamps[0].get('data-time') or '',
+                ''.join(timestamps[0].itertext()).strip()
+            ))
+        # Already extracted: empty it and drop the finished items before it,
+        # so the news list never holds more than the item being parsed
+        li.clear()
+        while li.getprevious() is not None:
+            del parent[0]
+
+
+def fetch_listing_items(page_url):
     """
-    Parses a single Economic Times article page to extract title, date, and content.
+    Streams a listing page into an incremental lxml parser and returns its news items
+    as (title, href, data-time, displayed date) tuples, or None if the page could not
+    be fetched or parsed. Each chunk is parsed as it arrives, so parsing overlaps the download.
     """
-    print(f"Scraping article content: {article_url}")
-    html_content = get_html_content(article_url)
-    if not html_content:
-        print(f"Failed to fetch HTML for {article_url}.")
+    parser = etree.HTMLPullParser(events=('end',), tag='li', encoding='utf-8', remove_comments=True)
+    items = []
+    try:
+        with SESSION.get(page_url, stream=True, timeout=10) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=16384):
+                parser.feed(chunk)
+                _read_listing_items(parser, items)
+        parser.close()
+        _read_listing_items(parser, items)
+    except requests.exceptions.RequestException as e:
+        logger.error("Failed to fetch %s: %s", page_url, e)
+        return None
+    except etree.XMLSyntaxError as e:  # Empty or truncated body
+        logger.error("Could not parse %s: %s", page_url, e)
         return None
 
-    soup = BeautifulSoup(html_content, 'lxml')
-
-    title = ""
-    date = ""
-
-    # --- Extract Title ---
-    title_element = soup.find('h1', {'class': 'artTitle'})
-    if not title_element:
-        title_element = soup.find('h1', {'class': 'article_title'})
-    if not title_element:
-        title_element = soup.find('h1')
-
-    if title_element:
-        title = title_element.get_text(strip=True)
-
-    # --- Extract Date ---
-    date_element = soup.find('time', {'class': 'publishedAt'})
-    if not date_element:
-        date_element = soup.find('div', {'class': 'publish_on'})
-    if not date_element:
-        date_element = soup.find('span', {'class': 'byline_data'})
-
-    if date_element:
-        date = date_element.get_text(strip=True)
-        match = re.search(r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4}', date)
-        if match:
-            date = match.group(0)
-        else:
-            match = re.search(r'\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}', date)
-            if match:
-                date = match.group(0)
-
-    # --- FINAL STRATEGY FOR ET: ONLY EXTRACT METADATA ---
-    return {
-        'title': title,
-        'date': date,
-        'content': "",
-        'url': article_url,
-        'source': 'Economic Times'
-    }
+    return items
 
 
 def scrape_economic_times_headlines(mongo_collection, num_articles_limit=10):
@@ -179,117 +124,94 @@ def scrape_economic_times_headlines(mongo_collection, num_articles_limit=10):
     It will only fetch metadata (title, URL, date) for ET articles.
     """
     if mongo_collection is None:
-        print("Error: DB collection not provided. Aborting ET scraper.")
+        logger.error("DB collection not provided. Aborting ET scraper.")
         return []
 
-    all_articles_data = []
-    seen_urls = set()
+    # Article URL -> metadata for every usable listing item, in page order
+    candidates = {}
 
     latest_et_date_in_db = get_latest_news_date(mongo_collection, "Economic Times")
     if latest_et_date_in_db:
-        print(
-            f"Latest Economic Times article in DB is from: {latest_et_date_in_db.strftime('%Y-%m-%d')}. Fetching newer news.")
+        logger.info("Latest Economic Times article in DB is from: %s. Fetching newer news.",
+                    latest_et_date_in_db.date())
     else:
-        print("No Economic Times articles found in DB. Fetching recent news.")
+        logger.info("No Economic Times articles found in DB. Fetching recent news.")
 
     urls_to_scrape = [
         'https://economictimes.indiatimes.com/news/latest-news',
         'https://economictimes.indiatimes.com/markets/stocks/news',
     ]
 
+    # The listing pages don't depend on each other, so download (and parse) them concurrently
     for page_url in urls_to_scrape:
-        print(f"Fetching news from listing page: {page_url}")
-        html_content = get_html_content(page_url)
-        if not html_content:
-            continue
+        logger.info("Fetching news from listing page: %s", page_url)
+    with ThreadPoolExecutor(max_workers=len(urls_to_scrape)) as executor:
+        listing_items = list(executor.map(fetch_listing_items, urls_to_scrape))
 
-        soup = BeautifulSoup(html_content, 'lxml')
-
-        news_list_container = soup.find('ul', class_='data')
-
-        if not news_list_container:
-            print(f"Could not find news list container on {page_url}. Please re-check HTML structure.")
+    for page_url, news_items in zip(urls_to_scrape, listing_items):
+        if news_items is None:
             continue
 
-        news_items = news_list_container.find_all('li', itemprop='itemListElement')
-
         if not news_items:
-            print(f"No news items found within the container on {page_url}. Please re-check LI structure.")
+            logger.warning("No news items found on %s. Please re-check HTML structure.", page_url)
             continue
 
-        for item in news_items:
-            link_tag = item.find('a', href=True)
-            timestamp_tag = item.find('span', class_='timestamp', attrs={'data-time': True})
-
-            if link_tag and timestamp_tag:
-                title = link_tag.get_text(strip=True)
-                article_url = link_tag['href']
-
-                date_str = timestamp_tag['data-time']
+        for title, article_url, date_str, display_date_text in news_items:
+            if article_url:
                 formatted_date_str = None
                 article_date_obj = None
 
                 try:
-                    parsed_date_obj = dt_class.fromisoformat(date_str.replace('Z', '+00:00'))
-                    formatted_date_str = parsed_date_obj.strftime('%Y-%m-%d')
-                    article_date_obj = parsed_date_obj
+                    # Only the date matters, so parse just the YYYY-MM-DD prefix of the ISO timestamp
+                    article_date_obj = dt_class.fromisoformat(date_str[:10])
+                    formatted_date_str = date_str[:10]
                 except ValueError:
-                    display_date_text = timestamp_tag.get_text(strip=True)
-                    match = re.search(r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4}',
-                                      display_date_text)
-                    if match:
-                        formatted_date_str = match.group(0)
+                    formatted_date_str, date_format = _find_display_date(display_date_text)
+                    if formatted_date_str:
                         try:
-                            article_date_obj = dt_class.strptime(formatted_date_str, '%b %d, %Y')
+                            article_date_obj = dt_class.strptime(formatted_date_str, date_format)
                         except ValueError:
                             pass
                     else:
-                        match = re.search(r'\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}',
-                                          display_date_text)
-                        if match:
-                            formatted_date_str = match.group(0)
-                            try:
-                                article_date_obj = dt_class.strptime(formatted_date_str, '%d %b %Y')
-                            except ValueError:
-                                pass
-                        else:
-                            formatted_date_str = display_date_text
+                        formatted_date_str = display_date_text
 
                 if latest_et_date_in_db and article_date_obj and article_date_obj.date() <= latest_et_date_in_db.date():
-                    print(
-                        f"Skipping {article_url} (older than latest in DB: {latest_et_date_in_db.strftime('%Y-%m-%d')}).")
+                    # %s arguments are only formatted if DEBUG is enabled
+                    logger.debug("Skipping %s (older than latest in DB: %s).", article_url, latest_et_date_in_db.date())
                     continue
 
                 if not article_url.startswith('http'):
                     article_url = f"https://economictimes.indiatimes.com{article_url}"
 
-                if "/articleshow/" in article_url and "economictimes.indiatimes.com" in article_url and article_url not in seen_urls:
-                    print(f"Attempting to process article: {article_url}")
-
-                    article_details = parse_article_page(article_url)
-
-                    if article_details:
-                        article_details['title'] = title
-                        article_details['date'] = formatted_date_str
-                        article_details['source'] = "Economic Times"
-
-                        inserted_successfully = insert_article_into_mongodb(mongo_collection, article_details)
-                        if inserted_successfully:
-                            all_articles_data.append(article_details)
-                        else:
-                            all_articles_data.append(article_details)
-                    else:
-                        print(f"Warning: Missing title or URL for article: {article_url}. Skipping.")
-                        continue  # Skip to next article if metadata extraction failed
-
-                    seen_urls.add(article_url)
-                    time.sleep(1.5)
+                if "/articleshow/" in article_url and "economictimes.indiatimes.com" in article_url:
+                    # Only metadata is stored for ET and the listing already has it,
+                    # so the article page itself is not fetched.
+                    if article_url not in candidates:
+                        candidates[article_url] = normalize_article(
+                            title=title,
+                            content="",
+                            url=article_url,
+                            # A date that could not be parsed is kept as displayed
+                            publication_date=article_date_obj or formatted_date_str,
+                            source="Economic Times"
+                        )
+
+    # One query tells which of the listed articles are already stored
+    existing_urls = find_existing_urls(mongo_collection, list(candidates))
 
-                if len(all_articles_data) >= num_articles_limit:
-                    print(f"Reached article limit ({num_articles_limit}) for testing, stopping.")
-                    break
+    all_articles_data = []
+    pending_ops = []
+    for article_url, article_details in candidates.items():
+        if article_url in existing_urls:
+            continue
+        logger.debug("Attempting to process article: %s", article_url)
+        pending_ops.append(build_insert_op(article_details))
+        all_articles_data.append(article_details)
 
         if len(all_articles_data) >= num_articles_limit:
+            logger.info("Reached article limit (%s) for testing, stopping.", num_articles_limit)
             break
 
+    # Everything found on the listing pages goes to MongoDB in one round trip
+    flush_insert_ops(mongo_collection, pending_ops)
     return all_articles_data
\ No newline at end of file
@@ -0,0 +1,124 @@
+# news_store.py
+# MongoDB helpers shared by every news source: the stored article shape,
+# known-URL lookups and batched inserts.
+
+import logging
+from datetime import datetime as dt_class
+import pymongo
+from pymongo import InsertOne
+from pymongo.errors import BulkWriteError
+
+# Entry points route this logger through the shared queue with setup_queue_logging
+logger = logging.getLogger('news_store')
+logger.setLevel(logging.INFO)
+
+
+def get_latest_news_date(mongo_collection, source_name):
+    """
+    Retrieves the latest publication_date for a given source from MongoDB.
+    Returns datetime object or None if no data found.
+    """
+    if mongo_collection is None:
+        return None
+
+    latest_article = mongo_collection.find(
+        {"source": source_name, "publication_date": {"$ne": None}}
+    ).sort("publication_date", pymongo.DESCENDING).limit(1)
+
+    try:
+        latest = latest_article.next()
+        if isinstance(latest.get('publication_date'), dt_class):
+            return latest['publication_date']
+        elif isinstance(latest.get('publication_date'), str):
+            try:
+                return dt_class.strptime(latest['publication_date'], '%Y-%m-%d')
+            except ValueError:
+                return None
+        return None
+    except StopIteration:
+        return None
+
+
+# URLs per $in query when checking which articles are already stored
+EXISTING_URL_CHUNK_SIZE = 1000
+
+
+def find_existing_urls(mongo_collection, urls):
+    """
+    Returns the subset of `urls` that is already stored, so known articles can be
+    dropped before any work is done on them. Only the url field is projected, so the
+    planner can answer the query from the unique url index alone.
+    """
+    if mongo_collection is None or not urls:
+        return set()
+
+    existing = set()
+    for start in range(0, len(urls), EXISTING_URL_CHUNK_SIZE):
+        chunk = urls[start:start + EXISTING_URL_CHUNK_SIZE]
+        cursor = mongo_collection.find({'url': {'$in': chunk}}, {'url': 1, '_id': 0})
+        existing.update(doc['url'] for doc in cursor)
+    return existing
+
+
+# The fields stored for every article
+ARTICLE_FIELDS = ('url', 'title', 'content', 'publication_date', 'source',
+                  'sentiment_score', 'companies_mentioned', 'sectors_mentioned')
+
+
+def normalize_article(*, title, content, url, publication_date, source):
+    """
+    Builds an article dict in the shape stored in MongoDB, with the NLP fields empty.
+    Every source goes through here, so the rest of the pipeline can rely on all
+    ARTICLE_FIELDS being present.
+    """
+    return {
+        'title': title,
+        'content': content,
+        'url': url,
+        'publication_date': publication_date,
+        'source': source,
+        'sentiment_score': None,
+        'companies_mentioned': [],
+        'sectors_mentioned': []
+    }
+
+
+def build_insert_op(article_data):
+    """
+    Returns the insert operation for an article built by normalize_article.
+    Callers only queue URLs that are not stored yet, so no upsert is needed.
+    The operations are sent to MongoDB in batches by flush_insert_ops.
+    """
+    return InsertOne({field: article_data[field] for field in ARTICLE_FIELDS})
+
+
+def flush_insert_ops(collection, ops):
+    """
+    Sends the queued inserts to MongoDB in one unordered bulk_write and clears
+    the list. Returns the number of articles that were inserted.
+    """
+    if not ops:
+        return 0
+    if collection is None:
+        logger.warning("MongoDB collection not available. Skipping insertion.")
+        ops.clear()
+        return 0
+
+    try:
+        result = collection.bulk_write(ops, ordered=False)
+        written = result.inserted_count
+        logger.info("Bulk write complete: %s articles inserted.", written)
+    except BulkWriteError as bwe:
+        # ordered=False keeps going past failed ops, so the rest of the batch is still written.
+        # Duplicates only happen if another run stored the same URL since it was checked.
+        errors = bwe.details['writeErrors']
+        duplicate_errors = [err for err in errors if err['code'] == 11000]
+        written = bwe.details['nInserted']
+        logger.warning("Bulk write finished with %s errors (%s duplicate URLs). %s articles inserted.",
+                       len(errors), len(duplicate_errors), written)
+    except Exception as e:
+        logger.error("Error writing %s articles to MongoDB: %s", len(ops), e)
+        written = 0
+
+    ops.clear()
+    return written
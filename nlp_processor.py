@@ -3,6 +3,7 @@ from collections import defaultdict
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
 from scipy.special import softmax
 import numpy as np
+import threading
 import time
 
 # --- Global FinBERT Model Variables ---
@@ -143,7 +144,13 @@ def extract_companies_and_sectors(text):
         print("spaCy model not loaded. Cannot perform entity extraction.")
         return [], []
 
-    doc = nlp_spacy(text)
+    return _companies_and_sectors_from_doc(nlp_spacy(text), text)
+
+
+def _companies_and_sectors_from_doc(doc, text):
+    """
+    Collects company names from a parsed spaCy doc and sectors from the keywords in its text.
+    """
     companies = set()
     sectors = set()
 
@@ -164,7 +171,73 @@ def extract_companies_and_sectors(text):
     return list(companies), list(sectors)
 
 
-# --- Processing and Update Functions ---
+# --- Batch Functions (used at ingestion time) ---
+
+def score_batch(texts, batch_size=16):
+    """
+    Batched version of get_sentiment_score: runs FinBERT over the texts in chunks
+    and returns one positive-sentiment probability per text (None where it failed).
+    """
+    if finbert_tokenizer is None or finbert_model is None:
+        print("FinBERT model not loaded. Cannot perform sentiment analysis.")
+        return [None] * len(texts)
+
+    positive_index = finbert_labels.index('positive')
+    scores = []
+    for start in range(0, len(texts), batch_size):
+        chunk = texts[start:start + batch_size]
+        try:
+            inputs = finbert_tokenizer(chunk, return_tensors='pt', padding=True, truncation=True, max_length=512)
+            outputs = finbert_model(**inputs)
+            probabilities = softmax(outputs.logits.detach().numpy(), axis=1)
+            scores.extend(float(p) for p in probabilities[:, positive_index])
+        except Exception as e:
+            print(f"Error during batched sentiment analysis of {len(chunk)} texts: {e}")
+            scores.extend([None] * len(chunk))
+    return scores
+
+
+def extract_batch(texts):
+    """
+    Batched version of extract_companies_and_sectors using spaCy's nlp.pipe.
+    Returns a (companies, sectors) tuple per text.
+    """
+    if nlp_spacy is None:
+        print("spaCy model not loaded. Cannot perform entity extraction.")
+        return [([], []) for _ in texts]
+
+    return [_companies_and_sectors_from_doc(doc, text) for doc, text in zip(nlp_spacy.pipe(texts), texts)]
+
+
+# The news sources are collected in parallel threads; the models are loaded once and
+# run one batch at a time, so concurrent callers take turns here.
+_annotate_lock = threading.Lock()
+
+
+def annotate_articles(articles):
+    """
+    Fills in sentiment_score, companies_mentioned and sectors_mentioned on freshly
+    fetched article dicts, so they are stored complete by the initial insert instead
+    of being read back and rewritten by the passes below. Uses the same minimum
+    content lengths as those passes; shorter articles keep their defaults.
+    """
+    with _annotate_lock:
+        to_score = [article for article in articles if len(article.get('content') or '') >= 50]
+        to_tag = [article for article in to_score if len(article['content']) >= 100]
+
+        if to_score:
+            load_finbert_model()
+            for article, score in zip(to_score, score_batch([article['content'] for article in to_score])):
+                article['sentiment_score'] = score
+
+        if to_tag:
+            load_spacy_model()
+            for article, (companies, sectors) in zip(to_tag, extract_batch([article['content'] for article in to_tag])):
+                article['companies_mentioned'] = companies
+                article['sectors_mentioned'] = sectors
+
+
+# --- Processing and Update Functions (backfill for articles stored without NLP fields) ---
 
 def process_and_update_sentiment(mongo_collection):
     """
@@ -0,0 +1,63 @@
+# utils.py
+# Small helpers shared by the scrapers and the news pipeline.
+
+import time
+import threading
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+_log_queue = queue.Queue(-1)
+_log_listener = None
+_log_lock = threading.Lock()
+
+
+def setup_queue_logging(*logger_names):
+    """
+    Routes the named loggers through one shared queue. Callers only enqueue records;
+    a single background listener formats and writes them, so a slow terminal never
+    holds up a worker thread. Meant to be called from an entry point: the listener is
+    started on the first call, and later calls only attach loggers that are not routed yet.
+    """
+    global _log_listener
+    with _log_lock:
+        if _log_listener is None:
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+            _log_listener = QueueListener(_log_queue, handler)
+            _log_listener.start()
+            atexit.register(_log_listener.stop)  # Flush whatever is still queued on exit
+
+        for name in logger_names:
+            logger = logging.getLogger(name)
+            if not any(isinstance(h, QueueHandler) for h in logger.handlers):
+                logger.addHandler(QueueHandler(_log_queue))
+                logger.propagate = False
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket. acquire() only waits when callers are running ahead
+    of the allowed rate, so time already spent on a slow request counts towards
+    the delay instead of being added on top of it.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            # Take the token now, even if it is not there yet, and wait out the
+            # deficit outside the lock so the other callers can queue behind it
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)